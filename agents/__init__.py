@@ -7,18 +7,36 @@ This package contains specialized agents for content creation:
 - Writer Agent: Creates initial content drafts
 - Editor Agent: Reviews and improves content quality
 - SEO Agent: Optimizes content for search engines
+
+Agent classes are imported lazily (PEP 562) so importing the package
+does not pull in the heavy crewai/LLM stack until an agent is actually
+used, keeping cold-start latency low for tooling that only needs part
+of the pipeline.
 """
 
-from .coordinator import CoordinatorAgent
-from .researcher import ResearchAgent
-from .writer import WriterAgent
-from .editor import EditorAgent
-from .seo_optimizer import SEOAgent
-
-__all__ = [
-    'CoordinatorAgent',
-    'ResearchAgent', 
-    'WriterAgent',
-    'EditorAgent',
-    'SEOAgent'
-] 
\ No newline at end of file
+import importlib
+
+_AGENT_MODULES = {
+    'CoordinatorAgent': '.coordinator',
+    'ResearchAgent': '.researcher',
+    'WriterAgent': '.writer',
+    'EditorAgent': '.editor',
+    'SEOAgent': '.seo_optimizer'
+}
+
+__all__ = list(_AGENT_MODULES)
+
+def __getattr__(name):
+    """Resolve agent classes on first access instead of at import time"""
+    try:
+        module_name = _AGENT_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name, __name__)
+    agent_class = getattr(module, name)
+    globals()[name] = agent_class  # Cache so later lookups skip __getattr__
+    return agent_class
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,56 @@
+"""
+Structured result records for the AI Multi-Agent Content Creation Pipeline
+
+These slotted, frozen dataclasses replace ad-hoc nested dicts for
+per-record validation output. Slotted instances avoid a per-object
+__dict__, which keeps memory flat when validation runs in high-volume
+batch loops, and attribute access skips the hash lookup a dict needs.
+"""
+
+from dataclasses import dataclass, asdict, fields
+from typing import Dict
+
+class DictAccessMixin:
+    """Dict-style read access so existing dict consumers keep working"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return [field.name for field in fields(self)]
+
+    def as_dict(self) -> Dict:
+        """Convert to a plain dict (e.g., for JSON serialization)"""
+        return asdict(self)
+
+@dataclass(frozen=True, slots=True)
+class WordCountCheck(DictAccessMixin):
+    """Result of the word count validation check"""
+    current: int
+    target_range: str
+    passed: bool
+
+@dataclass(frozen=True, slots=True)
+class StructureCheck(DictAccessMixin):
+    """Result of the content structure validation check"""
+    has_introduction: bool
+    has_conclusion: bool
+    has_headings: bool
+
+@dataclass(frozen=True, slots=True)
+class KeywordDensityCheck(DictAccessMixin):
+    """Result of the keyword density validation check"""
+    density: Dict[str, float]
+    target_range: str
+    passed: bool
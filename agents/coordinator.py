@@ -8,30 +8,230 @@ The Coordinator Agent is responsible for:
 - Coordinating agent interactions and data flow
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import copy
+import functools
+import hashlib
+import itertools
+import json
+import re
+import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # Optional speedup - stdlib json is the fallback
+    orjson = None
+from typing import Dict, Any, List, Optional, Callable
 from crewai import Agent, Task, Crew
+from agents._types import WordCountCheck, StructureCheck, KeywordDensityCheck
 from utils.llm_config import configure_llm
+from utils.semantic_cache import SemanticCache
+
+# Precompiled structure checks - each is a single C-level scan with no
+# intermediate line lists, shared across threads and processes
+_INTRO_RE = re.compile(r'\b(?:introduction|overview|begin|start)\b', re.IGNORECASE)
+_CONCLUSION_RE = re.compile(r'\b(?:conclusion|summary|final|end)\b', re.IGNORECASE)
+_HEADING_RE = re.compile(r'^(?:#|[A-Z][A-Z \t]{2,}$)', re.MULTILINE)
+_WORD_RE = re.compile(r'\S+')
+
+def _count_words(content: str) -> int:
+    """Count words without materializing the list str.split would build"""
+    return sum(1 for _ in _WORD_RE.finditer(content))
+
+# ASCII-only lowercase table. str.translate maps characters in one
+# C-level pass without the full Unicode case-mapping machinery, which is
+# all the mostly-ASCII content handled here needs.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def _unproxy(value: Any) -> Any:
+    """Recursively convert read-only mapping proxies to picklable dicts
+
+    Plain dicts are rebuilt too: the quality criteria are a dict whose
+    values are (nested) proxies, so recursion must descend through both
+    mapping types to produce something the process pool can pickle.
+    """
+    if isinstance(value, (MappingProxyType, dict)):
+        return {key: _unproxy(item) for key, item in value.items()}
+    return value
+
+def _validate_worker(content: str, criteria: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Module-level validation worker for process-pool fan-out
+
+    Validation only needs the method logic, not the LLM-backed agent,
+    so worker processes skip __init__ entirely.
+    """
+    coordinator = CoordinatorAgent.__new__(CoordinatorAgent)
+    return coordinator.validate_content_quality(content, {'quality_criteria': criteria})
+
+@functools.lru_cache(maxsize=32)
+def _type_specialized_templates(content_type: str) -> tuple:
+    """
+    Task templates specialized for one content type
+
+    Workloads usually cycle through a handful of content types, so the
+    content-type-invariant text is rendered once per type and cached.
+    Only the per-request placeholders (topic, word count, keywords)
+    remain to be filled at plan time.
+    """
+    return tuple(
+        {**template,
+         'description': template['description'].replace('{content_type}', content_type)}
+        for template in _TASK_TEMPLATES
+    )
+
+@functools.lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple) -> 're.Pattern':
+    """
+    Compile a single alternation that matches any keyword in one scan
+
+    Cached per keyword tuple so repeat validations on the same keyword
+    set skip pattern construction. Longer keywords are tried first so
+    overlapping keywords match their longest form. Matching is
+    case-insensitive so callers can scan the original content without
+    materializing a lowercased copy of the whole document.
+    """
+    escaped = sorted((re.escape(keyword.lower()) for keyword in keywords),
+                     key=len, reverse=True)
+    return re.compile('|'.join(escaped), re.IGNORECASE)
+
+# Validation results keyed by (content digest, criteria projection) so
+# retries and report rebuilds on identical content skip the O(n) scans.
+# Bounded FIFO eviction keeps the cache from growing without limit.
+_validation_cache: Dict[tuple, Dict[str, Any]] = {}
+_VALIDATION_CACHE_MAX = 512
+
+# Static plan skeletons shared by every plan. Per-plan values are merged in
+# at request time, so these are built once at import instead of per call.
+_STRUCTURE_REQUIREMENTS = MappingProxyType({
+    'has_introduction': True,
+    'has_conclusion': True,
+    'has_headings': True,
+    'max_paragraph_length': 150
+})
+
+_SEO_REQUIREMENTS = MappingProxyType({
+    'keyword_density': MappingProxyType({'min': 0.5, 'max': 3.0}),  # Percentage
+    'meta_title_length': MappingProxyType({'min': 30, 'max': 60}),
+    'meta_description_length': MappingProxyType({'min': 120, 'max': 160})
+})
+
+_PHASE_TIMELINE = MappingProxyType({
+    'research_phase': "15 minutes",
+    'writing_phase': "20 minutes",
+    'editing_phase': "10 minutes",
+    'seo_phase': "10 minutes",
+    'review_phase': "5 minutes"
+})
+
+# Task templates with dynamic descriptions filled in via str.format_map
+_TASK_TEMPLATES = (
+    # The research phase fans out into independent sub-queries that the
+    # DAG runner executes concurrently, then fans back in via the merge
+    # task before writing starts. fail_fast is off so one failed
+    # sub-query does not kill the whole plan.
+    {
+        'name': 'research_facts',
+        'agent': 'researcher',
+        'description': "Research key facts and statistics about '{topic}'",
+        'deliverables': ('key_facts', 'statistics'),
+        'fail_fast': False,
+        'estimated_time': '10 minutes'
+    },
+    {
+        'name': 'research_sources',
+        'agent': 'researcher',
+        'description': "Find credible sources and expert quotes for '{topic}'",
+        'deliverables': ('source_references', 'expert_quotes'),
+        'fail_fast': False,
+        'estimated_time': '10 minutes'
+    },
+    {
+        'name': 'research_competitors',
+        'agent': 'researcher',
+        'description': "Analyze existing coverage and competing content on '{topic}'",
+        'deliverables': ('competitor_analysis', 'research_gaps'),
+        'fail_fast': False,
+        'estimated_time': '10 minutes'
+    },
+    {
+        'name': 'research_merge',
+        'agent': 'researcher',
+        'description': "Synthesize research findings into a summary for '{topic}'",
+        'deliverables': ('research_summary', 'content_outline'),
+        'dependencies': ('research_facts', 'research_sources', 'research_competitors'),
+        'estimated_time': '5 minutes'
+    },
+    {
+        'name': 'content_writing',
+        'agent': 'writer',
+        'description': "Write a {word_count}-word {content_type}",
+        'deliverables': ('first_draft',),
+        'dependencies': ('research_merge',),
+        'estimated_time': '20 minutes'
+    },
+    {
+        'name': 'editing',
+        'agent': 'editor',
+        'description': "Review and improve content for clarity, flow, and grammar",
+        'deliverables': ('edited_content', 'improvement_notes'),
+        'dependencies': ('content_writing',),
+        'estimated_time': '10 minutes'
+    },
+    {
+        'name': 'seo_optimization',
+        'agent': 'seo',
+        'description': "Optimize content for SEO with keywords: {keywords}",
+        'deliverables': ('seo_optimized_content', 'meta_tags', 'seo_report'),
+        'dependencies': ('editing',),
+        'estimated_time': '10 minutes'
+    },
+    {
+        'name': 'final_review',
+        'agent': 'coordinator',
+        'description': "Conduct final quality assurance and approval",
+        'deliverables': ('final_content', 'quality_report'),
+        'dependencies': ('seo_optimization',),
+        'estimated_time': '5 minutes'
+    }
+)
 
 class CoordinatorAgent:
     """
     Coordinator Agent that orchestrates the content creation pipeline
     """
-    
-    def __init__(self):
+
+    # Shared across coordinator instances so repeated or near-duplicate
+    # requirement sets reuse a previously computed plan instead of
+    # re-triggering the downstream pipeline
+    _plan_cache = SemanticCache(similarity_threshold=0.9)
+
+    # Built once from the first instance; later instances copy it instead
+    # of re-running the full Agent construction
+    _agent_prototype: Optional[Agent] = None
+
+    def __init__(self, verbose: bool = False):
         self.llm = configure_llm('coordinator')
-        self.agent = self._create_agent()
-        
+        self.verbose = verbose
+        if (CoordinatorAgent._agent_prototype is None
+                or CoordinatorAgent._agent_prototype.verbose != verbose):
+            CoordinatorAgent._agent_prototype = self._create_agent()
+        self.agent = copy.copy(CoordinatorAgent._agent_prototype)
+
     def _create_agent(self) -> Agent:
         """Create the coordinator agent with specific configuration"""
         return Agent(
             role="Content Creation Coordinator",
             goal="Orchestrate the content creation pipeline to produce high-quality, SEO-optimized content",
-            backstory="""You are an experienced content project manager with expertise in coordinating 
-            content creation workflows. You understand how to break down content requirements into 
-            actionable tasks for specialized team members, ensure quality standards, and manage 
-            the flow of information between different specialists. You have a keen eye for detail 
+            backstory="""You are an experienced content project manager with expertise in coordinating
+            content creation workflows. You understand how to break down content requirements into
+            actionable tasks for specialized team members, ensure quality standards, and manage
+            the flow of information between different specialists. You have a keen eye for detail
             and can identify when content meets publication standards.""",
-            verbose=True,
+            verbose=self.verbose,
             allow_delegation=True,
             llm=self.llm
         )
@@ -46,6 +246,23 @@ class CoordinatorAgent:
         Returns:
             Detailed content creation plan
         """
+        # Non-semantic fields scope the cache; semantic fields are matched
+        # by similarity so near-duplicate requirements hit the same plan
+        cache_scope = (
+            requirements.get('content_type', 'Blog post'),
+            requirements.get('word_count', 1000) // 250
+        )
+        cache_text = ' '.join([
+            requirements.get('topic', ''),
+            requirements.get('target_audience', ''),
+            requirements.get('tone', ''),
+            ' '.join(requirements.get('seo_keywords', []))
+        ])
+
+        cached_plan = self._plan_cache.get(cache_scope, cache_text)
+        if cached_plan is not None:
+            return cached_plan
+
         plan = {
             'topic': requirements.get('topic', ''),
             'target_audience': requirements.get('target_audience', 'General audience'),
@@ -57,55 +274,123 @@ class CoordinatorAgent:
             'quality_criteria': self._define_quality_criteria(requirements),
             'timeline': self._estimate_timeline(requirements)
         }
-        
+
+        self._plan_cache.put(cache_scope, cache_text, plan)
+
         return plan
     
     def _generate_task_sequence(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate the sequence of tasks for content creation"""
-        tasks = [
-            {
-                'name': 'research',
-                'agent': 'researcher',
-                'description': f"Research comprehensive information about '{requirements.get('topic', '')}'",
-                'deliverables': ['research_summary', 'key_facts', 'source_references'],
-                'estimated_time': '15 minutes'
-            },
-            {
-                'name': 'content_writing',
-                'agent': 'writer',
-                'description': f"Write a {requirements.get('word_count', 1000)}-word {requirements.get('content_type', 'blog post')}",
-                'deliverables': ['first_draft'],
-                'dependencies': ['research'],
-                'estimated_time': '20 minutes'
-            },
-            {
-                'name': 'editing',
-                'agent': 'editor',
-                'description': "Review and improve content for clarity, flow, and grammar",
-                'deliverables': ['edited_content', 'improvement_notes'],
-                'dependencies': ['content_writing'],
-                'estimated_time': '10 minutes'
-            },
-            {
-                'name': 'seo_optimization',
-                'agent': 'seo',
-                'description': f"Optimize content for SEO with keywords: {', '.join(requirements.get('seo_keywords', []))}",
-                'deliverables': ['seo_optimized_content', 'meta_tags', 'seo_report'],
-                'dependencies': ['editing'],
-                'estimated_time': '10 minutes'
-            },
-            {
-                'name': 'final_review',
-                'agent': 'coordinator',
-                'description': "Conduct final quality assurance and approval",
-                'deliverables': ['final_content', 'quality_report'],
-                'dependencies': ['seo_optimization'],
-                'estimated_time': '5 minutes'
-            }
+        description_values = {
+            'topic': requirements.get('topic', ''),
+            'word_count': requirements.get('word_count', 1000),
+            'keywords': ', '.join(requirements.get('seo_keywords', []))
+        }
+        templates = _type_specialized_templates(requirements.get('content_type', 'blog post'))
+
+        # Templates without remaining placeholders are shared as-is;
+        # consumers treat tasks as read-only
+        return [
+            template if '{' not in template['description']
+            else {**template, 'description': template['description'].format_map(description_values)}
+            for template in templates
         ]
-        
-        return tasks
     
+    async def run_plan(
+        self,
+        plan: Dict[str, Any],
+        runners: Dict[str, Callable],
+        max_parallel_agents: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Execute a content plan's tasks concurrently where dependencies allow
+
+        Tasks are treated as a DAG keyed by name with 'dependencies' edges.
+        All tasks whose dependencies are satisfied run concurrently via
+        asyncio.gather, bounded by a semaphore to cap agent concurrency.
+
+        Args:
+            plan: Content creation plan containing the task list
+            runners: Mapping of task name to a callable or coroutine function
+                     accepting (task, results) and returning the task output
+            max_parallel_agents: Maximum number of tasks to run concurrently
+
+        Returns:
+            Dictionary mapping task names to their outputs
+        """
+        pending = {task['name']: task for task in plan.get('tasks', [])}
+        results: Dict[str, Any] = {}
+        semaphore = asyncio.Semaphore(max_parallel_agents)
+
+        async def _run_task(task: Dict[str, Any]) -> Any:
+            runner = runners[task['name']]
+            async with semaphore:
+                if asyncio.iscoroutinefunction(runner):
+                    return await runner(task, results)
+                return await asyncio.to_thread(runner, task, results)
+
+        while pending:
+            # All tasks whose dependencies are already satisfied can run now
+            ready = [task for task in pending.values()
+                     if all(dep in results for dep in task.get('dependencies', []))]
+
+            if not ready:
+                raise ValueError("Content plan contains unsatisfiable task dependencies")
+
+            outputs = await asyncio.gather(*(_run_task(task) for task in ready))
+
+            for task, output in zip(ready, outputs):
+                results[task['name']] = output
+                del pending[task['name']]
+
+        return results
+
+    async def akickoff_for_each(
+        self,
+        crew: Crew,
+        requirement_rows: List[Dict[str, Any]],
+        concurrency: int = 10,
+        max_retries: int = 3,
+        timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Kick off a crew once per requirement row, with bounded concurrency
+
+        Unlike crewai's synchronous kickoff_for_each, rows run through
+        kickoff_async under an asyncio.Semaphore, so wall-clock time for N
+        LLM-bound rows drops from N x latency to roughly
+        ceil(N / concurrency) x latency. Failed rows are retried with
+        exponential backoff and surfaced as exception objects in the
+        result list rather than aborting the whole batch.
+
+        Args:
+            crew: The crew to kick off for each row
+            requirement_rows: Input dictionaries, one per kickoff
+            concurrency: Maximum number of rows in flight at once
+            max_retries: Attempts per row before giving up
+            timeout: Optional per-attempt timeout in seconds
+
+        Returns:
+            List of crew outputs (or exceptions) in row order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _kickoff(row: Dict[str, Any]) -> Any:
+            async with semaphore:
+                delay = 1.0
+                for attempt in range(max_retries):
+                    try:
+                        return await asyncio.wait_for(
+                            crew.kickoff_async(inputs=row), timeout)
+                    except Exception:
+                        if attempt == max_retries - 1:
+                            raise
+                        await asyncio.sleep(delay)
+                        delay *= 2
+
+        return await asyncio.gather(*(_kickoff(row) for row in requirement_rows),
+                                    return_exceptions=True)
+
     def _define_quality_criteria(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Define quality criteria for the content"""
         return {
@@ -113,17 +398,8 @@ class CoordinatorAgent:
             'maximum_word_count': requirements.get('word_count', 1000) * 1.1,  # 110% of target
             'required_keywords': requirements.get('seo_keywords', []),
             'readability_score': 60,  # Minimum readability score
-            'structure_requirements': {
-                'has_introduction': True,
-                'has_conclusion': True,
-                'has_headings': True,
-                'max_paragraph_length': 150
-            },
-            'seo_requirements': {
-                'keyword_density': {'min': 0.5, 'max': 3.0},  # Percentage
-                'meta_title_length': {'min': 30, 'max': 60},
-                'meta_description_length': {'min': 120, 'max': 160}
-            }
+            'structure_requirements': _STRUCTURE_REQUIREMENTS,
+            'seo_requirements': _SEO_REQUIREMENTS
         }
     
     def _estimate_timeline(self, requirements: Dict[str, Any]) -> Dict[str, str]:
@@ -142,21 +418,23 @@ class CoordinatorAgent:
         
         return {
             'estimated_duration': f"{estimated_time} minutes",
-            'research_phase': "15 minutes",
-            'writing_phase': "20 minutes", 
-            'editing_phase': "10 minutes",
-            'seo_phase': "10 minutes",
-            'review_phase': "5 minutes"
+            **_PHASE_TIMELINE
         }
     
-    def validate_content_quality(self, content: str, plan: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_content_quality(self, content: str, plan: Dict[str, Any],
+                                 fail_fast: bool = False) -> Dict[str, Any]:
         """
         Validate that content meets the defined quality criteria
-        
+
+        Checks run in failure-dominated order (word count first, then
+        keyword density, then structure) so fail_fast callers skip the
+        remaining scans as soon as one check fails.
+
         Args:
             content: The content to validate
             plan: The content creation plan with quality criteria
-            
+            fail_fast: Return after the first failing check
+
         Returns:
             Validation results with pass/fail status and feedback
         """
@@ -170,51 +448,119 @@ class CoordinatorAgent:
         }
         
         # Word count check
-        word_count = len(content.split())
+        word_count = _count_words(content)
         min_words = criteria.get('minimum_word_count', 900)
         max_words = criteria.get('maximum_word_count', 1100)
         
-        validation_results['checks']['word_count'] = {
-            'current': word_count,
-            'target_range': f"{min_words}-{max_words}",
-            'passed': min_words <= word_count <= max_words
-        }
+        validation_results['checks']['word_count'] = WordCountCheck(
+            current=word_count,
+            target_range=f"{min_words}-{max_words}",
+            passed=min_words <= word_count <= max_words
+        )
         
         if not validation_results['checks']['word_count']['passed']:
             if word_count < min_words:
                 validation_results['improvements_needed'].append(f"Content is too short ({word_count} words). Add {min_words - word_count} more words.")
             else:
                 validation_results['improvements_needed'].append(f"Content is too long ({word_count} words). Remove {word_count - max_words} words.")
-        
+            if fail_fast:
+                return self._finalize_validation(validation_results)
+
+
         # Structure checks
         structure_reqs = criteria.get('structure_requirements', {})
         
-        # Check for introduction and conclusion
-        has_intro = any(keyword in content.lower()[:200] for keyword in ['introduction', 'overview', 'begin', 'start'])
-        has_conclusion = any(keyword in content.lower()[-200:] for keyword in ['conclusion', 'summary', 'final', 'end'])
-        
-        validation_results['checks']['structure'] = {
-            'has_introduction': has_intro,
-            'has_conclusion': has_conclusion,
-            'has_headings': '#' in content or any(line.isupper() for line in content.split('\n')),
-        }
+        # Keyword density check - all keywords are counted in one linear
+        # scan instead of re-scanning the content per keyword
+        keywords = tuple(criteria.get('required_keywords', []))
+        if keywords and word_count > 0:
+            # Scan the content in place; only the short matched substrings
+            # are normalized, never the full document
+            counts = Counter(match.group(0).translate(_ASCII_LOWER) for match in
+                             _keyword_pattern(keywords).finditer(content))
+            density_limits = criteria.get('seo_requirements', {}).get(
+                'keyword_density', {'min': 0.5, 'max': 3.0})
+
+            densities = {
+                keyword: round((counts.get(keyword.lower(), 0) / word_count) * 100, 2)
+                for keyword in keywords
+            }
+            in_range = {
+                keyword: density_limits['min'] <= density <= density_limits['max']
+                for keyword, density in densities.items()
+            }
+
+            validation_results['checks']['keyword_density'] = KeywordDensityCheck(
+                density=densities,
+                target_range=f"{density_limits['min']}-{density_limits['max']}%",
+                passed=all(in_range.values())
+            )
+
+            for keyword, ok in in_range.items():
+                if not ok:
+                    if densities[keyword] < density_limits['min']:
+                        validation_results['improvements_needed'].append(
+                            f"Keyword '{keyword}' density is too low ({densities[keyword]}%). Use it more often.")
+                    else:
+                        validation_results['improvements_needed'].append(
+                            f"Keyword '{keyword}' density is too high ({densities[keyword]}%). Reduce usage.")
+
+            if fail_fast and not validation_results['checks']['keyword_density']['passed']:
+                return self._finalize_validation(validation_results)
+
+        # Check for introduction and conclusion in the head and tail slices
+        has_intro = bool(_INTRO_RE.search(content, 0, 200))
+        has_conclusion = bool(_CONCLUSION_RE.search(content, max(0, len(content) - 200)))
+
+        validation_results['checks']['structure'] = StructureCheck(
+            has_introduction=has_intro,
+            has_conclusion=has_conclusion,
+            has_headings=bool(_HEADING_RE.search(content)),
+        )
         
-        # Calculate overall score
-        passed_checks = sum(1 for check in validation_results['checks'].values() 
-                          if isinstance(check, dict) and check.get('passed', True))
+        return self._finalize_validation(validation_results)
+
+    def validate_many(self, contents: List[str], plan: Dict[str, Any],
+                      max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Validate several content pieces in parallel across processes
+
+        Validation is pure CPU/string work, so for batch workloads a
+        process pool gives true parallelism instead of GIL-bound threads.
+        Small batches skip the pool to avoid process startup overhead.
+
+        Args:
+            contents: Content pieces to validate
+            plan: The content creation plan with quality criteria
+            max_workers: Worker process count (defaults to CPU count)
+
+        Returns:
+            Validation results in content order
+        """
+        if len(contents) <= 1:
+            return [self.validate_content_quality(content, plan) for content in contents]
+
+        criteria = _unproxy(plan.get('quality_criteria', {}))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_validate_worker, contents, itertools.repeat(criteria)))
+
+    def _finalize_validation(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Score the completed checks and attach feedback"""
+        passed_checks = sum(1 for check in validation_results['checks'].values()
+                          if check.get('passed', True))
         total_checks = len(validation_results['checks'])
-        
+
         if total_checks > 0:
             validation_results['overall_score'] = (passed_checks / total_checks) * 100
             validation_results['passed'] = validation_results['overall_score'] >= 80
-        
+
         # Generate feedback
         if validation_results['passed']:
             validation_results['feedback'].append("Content meets quality standards and is ready for publication.")
         else:
             validation_results['feedback'].append("Content needs improvements before publication.")
             validation_results['feedback'].extend(validation_results['improvements_needed'])
-        
+
         return validation_results
     
     def create_final_report(self, content: str, plan: Dict[str, Any], agent_outputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -229,17 +575,23 @@ class CoordinatorAgent:
         Returns:
             Comprehensive final report
         """
-        validation = self.validate_content_quality(content, plan)
-        
+        validation = self._validate_cached(content, plan)
+
         report = {
             'content_metadata': {
                 'topic': plan.get('topic'),
-                'word_count': len(content.split()),
+                'word_count': _count_words(content),
                 'target_audience': plan.get('target_audience'),
                 'content_type': plan.get('content_type'),
                 'creation_date': None  # Would be set to current timestamp
             },
-            'quality_assessment': validation,
+            # Convert check records to plain dicts at the report boundary
+            # so the report stays JSON-serializable
+            'quality_assessment': {
+                **validation,
+                'checks': {name: check.as_dict()
+                           for name, check in validation['checks'].items()}
+            },
             'agent_contributions': {
                 'research': agent_outputs.get('research', {}),
                 'writing': agent_outputs.get('writing', {}),
@@ -253,6 +605,44 @@ class CoordinatorAgent:
         
         return report
     
+    def as_json(self, report: Dict[str, Any]) -> bytes:
+        """
+        Serialize a final report to JSON bytes
+
+        Uses orjson when available - its C-level encoder with native
+        dataclass support is several times faster than stdlib json,
+        which matters when batch runs return thousands of reports.
+        Callers receive bytes to avoid a second UTF-8 encode downstream.
+
+        Args:
+            report: Final report from create_final_report
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(report)
+        return json.dumps(report).encode('utf-8')
+
+    def _validate_cached(self, content: str, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate content, reusing cached results for identical inputs"""
+        criteria = plan.get('quality_criteria', {})
+        cache_key = (
+            hashlib.sha256(content.encode()).digest(),
+            criteria.get('minimum_word_count', 900),
+            criteria.get('maximum_word_count', 1100),
+            tuple(criteria.get('required_keywords', []))
+        )
+
+        validation = _validation_cache.get(cache_key)
+        if validation is None:
+            validation = self.validate_content_quality(content, plan)
+            if len(_validation_cache) >= _VALIDATION_CACHE_MAX:
+                _validation_cache.pop(next(iter(_validation_cache)))
+            _validation_cache[cache_key] = validation
+
+        return validation
+
     def _generate_final_recommendations(self, validation: Dict[str, Any], agent_outputs: Dict[str, Any]) -> List[str]:
         """Generate final recommendations based on all agent outputs"""
         recommendations = []
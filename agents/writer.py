@@ -8,17 +8,243 @@ The Writer Agent is responsible for:
 - Incorporating research findings effectively
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import functools
+import re
+import string
+import sys
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Dict, Any, Iterator, List, Optional
 from crewai import Agent, Task
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from utils.llm_config import configure_llm
+from utils.semantic_cache import SemanticCache
+
+
+# Section bodies that depend only on the topic are compiled once as
+# string.Template objects; rendering is a single substitute() call
+_CHALLENGES_TEMPLATE = string.Template(
+    "While $topic offers significant benefits, it's important to be aware of potential challenges and considerations:\n\n"
+    "**Implementation Complexity**: Getting started with $topic may require significant planning and resources.\n\n"
+    "**Learning Curve**: Team members may need training and time to adapt to new approaches.\n\n"
+    "**Initial Costs**: Upfront investment may be substantial, though long-term ROI is typically positive.\n\n"
+    "**Change Management**: Organizations must be prepared to manage the transition effectively.\n\n"
+    "Despite these challenges, most organizations find that the benefits of $topic far outweigh the difficulties. The key is proper planning and realistic expectations."
+)
+
+_BEST_PRACTICES_TEMPLATE = string.Template(
+    "To maximize success with $topic, consider these proven best practices:\n\n"
+    "**Start Small**: Begin with a pilot project to test approaches and learn before scaling up.\n\n"
+    "**Set Clear Goals**: Define specific, measurable objectives for your $topic initiative.\n\n"
+    "**Invest in Training**: Ensure team members have the knowledge and skills needed for success.\n\n"
+    "**Monitor Progress**: Regularly track metrics and adjust approaches based on results.\n\n"
+    "**Stay Flexible**: Be prepared to adapt strategies as you learn and circumstances change.\n\n"
+    "**Seek Expert Guidance**: Consider working with experienced professionals to accelerate progress.\n\n"
+    "Remember, success with $topic is often a journey rather than a destination. Continuous improvement and learning are essential components of long-term success."
+)
+
+_FUTURE_TEMPLATE = string.Template(
+    "Looking ahead, the future of $topic appears bright with several exciting developments on the horizon:\n\n"
+    "**Emerging Trends**: New approaches and technologies are constantly being developed, making $topic more accessible and effective than ever before.\n\n"
+    "**Increased Adoption**: As more organizations recognize the value of $topic, we can expect to see broader implementation across industries.\n\n"
+    "**Innovation Opportunities**: The field continues to evolve, creating new possibilities for creative applications and solutions.\n\n"
+    "**Integration Advances**: Future developments will likely focus on better integration with existing systems and processes.\n\n"
+    "For those considering $topic, now is an excellent time to begin exploring its potential. Early adopters often have the advantage of learning and adapting before widespread adoption makes the field more competitive."
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_challenges(topic: str) -> str:
+    """Render the challenges section for a topic (cached)"""
+    return _CHALLENGES_TEMPLATE.substitute(topic=topic)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_best_practices(topic: str) -> str:
+    """Render the best practices section for a topic (cached)"""
+    return _BEST_PRACTICES_TEMPLATE.substitute(topic=topic)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_future(topic: str) -> str:
+    """Render the future outlook section for a topic (cached)"""
+    return _FUTURE_TEMPLATE.substitute(topic=topic)
+
+
+_DocProfile = namedtuple('_DocProfile', [
+    'word_count', 'sentence_count', 'paragraph_count', 'heading_count'
+])
+
+
+def _profile_document(content: str) -> _DocProfile:
+    """
+    Collect every counter the analyzers need in one pass over the lines
+
+    Readability, structure and the writing notes each used to re-split
+    the full document; this walks the lines once, tracking words,
+    sentence enders, blank-line paragraph boundaries and headings.
+    """
+    word_count = 0
+    sentence_count = 0
+    paragraph_count = 0
+    heading_count = 0
+    in_paragraph = False
+
+    for line in content.splitlines():
+        if not line.strip():
+            in_paragraph = False
+            continue
+
+        if not in_paragraph:
+            paragraph_count += 1
+            in_paragraph = True
+
+        word_count += len(line.split())
+        sentence_count += line.count('.')
+        if line.startswith('#'):
+            heading_count += 1
+
+    return _DocProfile(
+        word_count=word_count,
+        sentence_count=sentence_count,
+        paragraph_count=paragraph_count,
+        heading_count=heading_count
+    )
+
+
+# Simple tone indicators, with one compiled alternation that finds every
+# indicator in a single case-insensitive scan (longest-first so 'your'
+# is not shadowed by 'you')
+_TONE_INDICATORS = {
+    'Professional': ('analysis', 'implementation', 'strategic', 'comprehensive', 'significant'),
+    'Casual': ('you', 'your', 'easy', 'simple', 'great', 'awesome'),
+    'Technical': ('system', 'process', 'methodology', 'parameters', 'optimization')
+}
+_TONE_RE = re.compile(
+    '|'.join(sorted(
+        (re.escape(indicator)
+         for indicators in _TONE_INDICATORS.values()
+         for indicator in indicators),
+        key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+
+def _build_tone_automaton():
+    """
+    Precompile the multi-pattern tone matcher once at import time
+
+    Each indicator is added in lowercase, capitalized and uppercase
+    forms (all tagged with the lowercase name), so matching runs
+    directly on the original text without allocating a lowercased copy
+    of the whole document.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for indicators in _TONE_INDICATORS.values():
+        for indicator in indicators:
+            for variant in {indicator, indicator.capitalize(), indicator.upper()}:
+                automaton.add_word(variant, indicator)
+    automaton.make_automaton()
+    return automaton
+
+
+_TONE_AUTOMATON = _build_tone_automaton()
+
+
+def _find_tone_indicators(content: str) -> set:
+    """Return the set of tone indicators present in the content"""
+    if _TONE_AUTOMATON is not None:
+        return {indicator for _, indicator in _TONE_AUTOMATON.iter(content)}
+    return {match.lower() for match in _TONE_RE.findall(content)}
+
+
+_INTRO_TEMPLATES = {
+    'Professional': """In today's rapidly evolving landscape, {topic} has emerged as a critical factor for success. Understanding its implications and applications can provide significant advantages for organizations and individuals alike. This comprehensive guide explores the essential aspects of {topic}, providing insights that can help you navigate this important subject effectively.""",
+
+    'Casual': """Have you ever wondered about {topic}? You're not alone! This fascinating subject has been gaining attention lately, and for good reason. Whether you're just getting started or looking to deepen your understanding, this guide will walk you through everything you need to know about {topic} in a clear, accessible way.""",
+
+    'Technical': """{topic} represents a significant development in the field, offering both opportunities and challenges for implementation. This analysis provides a comprehensive examination of {topic}, including its technical foundations, practical applications, and strategic implications for stakeholders."""
+}
+
+_INTRO_ADDITION = "\n\nThroughout this article, we'll examine the key components of {topic}, discuss its benefits and challenges, and provide practical insights that you can apply immediately. Our goal is to equip you with the knowledge and understanding necessary to make informed decisions about {topic}."
+
+_CONCLUSION_TEMPLATES = {
+    'Professional': """In conclusion, {topic} represents a significant opportunity for those who approach it strategically. The key to success lies in understanding its fundamental principles, recognizing both opportunities and challenges, and implementing best practices consistently. As the landscape continues to evolve, staying informed and adaptable will be crucial for maximizing the benefits of {topic}.""",
+
+    'Casual': """So there you have it – everything you need to know about {topic}! Remember, the key is to start small, stay consistent, and keep learning as you go. Don't be afraid to experiment and find what works best for your situation. With the right approach, {topic} can make a real difference in achieving your goals.""",
+
+    'Technical': """The analysis of {topic} reveals significant potential for implementation across various contexts. Success depends on careful planning, thorough understanding of requirements, and systematic execution of best practices. Future developments in this area warrant continued monitoring and evaluation."""
+}
+
+_CONCLUSION_ADDITION = "\n\nAs you move forward with implementing {topic}, remember that continuous learning and adaptation are key. Consider how these insights apply to your specific situation and take the first steps toward implementation today."
+
+
+def _template_word_stats(templates: Dict[str, str]) -> Dict[str, tuple]:
+    """Per tone: template word count without the topic, and topic slot count"""
+    return {
+        tone: (len(template.format(topic='x').split()) - template.count('{topic}'),
+               template.count('{topic}'))
+        for tone, template in templates.items()
+    }
+
+
+_INTRO_WORD_STATS = _template_word_stats(_INTRO_TEMPLATES)
+_CONCLUSION_WORD_STATS = _template_word_stats(_CONCLUSION_TEMPLATES)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_introduction(topic: str, tone: str, target_words: int) -> str:
+    """Render the introduction template for a topic and tone (cached)"""
+    if tone not in _INTRO_TEMPLATES:
+        tone = 'Professional'
+    base_intro = _INTRO_TEMPLATES[tone].format(topic=topic)
+
+    # Expand if needed to meet word target; the rendered length comes
+    # from the precomputed template stats instead of re-splitting
+    base_words, topic_slots = _INTRO_WORD_STATS[tone]
+    if base_words + topic_slots * len(topic.split()) < target_words:
+        base_intro += _INTRO_ADDITION.format(topic=topic)
+
+    return base_intro
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_conclusion(topic: str, tone: str, target_words: int) -> str:
+    """Render the conclusion template for a topic and tone (cached)"""
+    if tone not in _CONCLUSION_TEMPLATES:
+        tone = 'Professional'
+    base_conclusion = _CONCLUSION_TEMPLATES[tone].format(topic=topic)
+
+    # Add call to action if needed
+    base_words, topic_slots = _CONCLUSION_WORD_STATS[tone]
+    if base_words + topic_slots * len(topic.split()) < target_words:
+        base_conclusion += _CONCLUSION_ADDITION.format(topic=topic)
+
+    return base_conclusion
+
 
 class WriterAgent:
     """
     Content Writer Agent specialized in creating engaging written content
     """
-    
-    def __init__(self):
+
+    # Shared across instances: semantically equivalent requests (e.g.
+    # 'benefits of solar' vs 'solar power benefits') reuse a prior draft
+    _draft_cache = SemanticCache(similarity_threshold=0.92)
+
+    def __init__(self, verbose: bool = False):
         self.llm = configure_llm('writer')
+        self.verbose = verbose
         self.agent = self._create_agent()
         
     def _create_agent(self) -> Agent:
@@ -31,78 +257,219 @@ class WriterAgent:
             transforming research data into engaging narratives that capture readers' attention 
             while maintaining accuracy and professionalism. You understand different writing 
             styles and can adapt your tone to match the target audience and content purpose.""",
-            verbose=True,
+            verbose=self.verbose,
             allow_delegation=False,
             llm=self.llm
         )
     
-    def create_content(self, research_data: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
+    def create_content(self, research_data: Dict[str, Any], requirements: Dict[str, Any],
+                       include_metrics: bool = True) -> Dict[str, Any]:
         """
         Create content based on research data and requirements
-        
+
         Args:
             research_data: Research findings from the Research Agent
             requirements: Content requirements and specifications
-            
+            include_metrics: Skip the readability/tone/structure/notes
+                analyses when the caller only needs the draft
+
         Returns:
             Content creation results with draft and metadata
         """
+        cache_scope, cache_text = self._draft_cache_key(research_data, requirements)
+        # Metric-free outputs must never satisfy a full request
+        cache_scope = cache_scope + (include_metrics,)
+        cached_draft = self._draft_cache.get(cache_scope, cache_text)
+        if cached_draft is not None:
+            return cached_draft
+
         # Analyze requirements and research
         content_plan = self._create_content_plan(research_data, requirements)
-        
+
         # Generate content sections
         content_sections = self._generate_content_sections(content_plan)
         
         # Assemble final content
         final_content = self._assemble_content(content_sections, requirements)
         
-        # Create writer output
+        # Create writer output; one profiling pass collects every
+        # counter the analyzers share. The four analyses are
+        # independent, so they run on a small thread pool and overlap
+        # with each other (and any I/O elsewhere in the pipeline)
+        profile = _profile_document(final_content)
+
+        if not include_metrics:
+            # Draft-only callers pay zero analyzer cost
+            writer_output = {
+                'content': final_content,
+                'content_plan': content_plan,
+                'word_count': profile.word_count
+            }
+            self._draft_cache.put(cache_scope, cache_text, writer_output)
+            return writer_output
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            readability = pool.submit(self._analyze_readability, final_content, profile)
+            tone = pool.submit(self._analyze_tone, final_content, requirements)
+            structure = pool.submit(self._analyze_structure, final_content, profile)
+
         writer_output = {
             'content': final_content,
             'content_plan': content_plan,
-            'word_count': len(final_content.split()),
-            'readability_metrics': self._analyze_readability(final_content),
-            'tone_analysis': self._analyze_tone(final_content, requirements),
-            'structure_analysis': self._analyze_structure(final_content),
-            'writing_notes': self._generate_writing_notes(content_plan, final_content)
+            'word_count': profile.word_count,
+            'readability_metrics': readability.result(),
+            'tone_analysis': tone.result(),
+            'structure_analysis': structure.result(),
+            # Notes are plain arithmetic on precomputed counts — consume
+            # the generator inline rather than paying pool dispatch for it
+            'writing_notes': list(self._generate_writing_notes(content_plan, final_content, profile.word_count))
         }
-        
+
+        self._draft_cache.put(cache_scope, cache_text, writer_output)
+
         return writer_output
-    
+
+    def _draft_cache_key(self, research_data: Dict[str, Any], requirements: Dict[str, Any]) -> tuple:
+        """Build the semantic cache scope and text for a draft request"""
+        # Non-semantic fields scope the cache; the topic and free-text
+        # requirements are matched by similarity so near-duplicate
+        # requests reuse the same draft
+        cache_scope = (
+            requirements.get('content_type', 'Blog post'),
+            requirements.get('tone', 'Professional'),
+            requirements.get('word_count', 1000) // 250
+        )
+        cache_text = ' '.join([
+            research_data.get('topic', requirements.get('topic', '')),
+            requirements.get('target_audience', ''),
+            ' '.join(requirements.get('seo_keywords', []))
+        ])
+        return cache_scope, cache_text
+
+    async def acreate_content(self, research_data: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of create_content that drafts sections concurrently
+
+        Sections are independent of one another, so fanning them out
+        bounds wall time at the slowest section instead of the sum of
+        all of them once section writing is backed by LLM calls.
+        """
+        cache_scope, cache_text = self._draft_cache_key(research_data, requirements)
+        cached_draft = self._draft_cache.get(cache_scope, cache_text)
+        if cached_draft is not None:
+            return cached_draft
+
+        content_plan = self._create_content_plan(research_data, requirements)
+
+        content_sections = await self._agenerate_content_sections(content_plan)
+
+        final_content = self._assemble_content(content_sections, requirements)
+
+        profile = _profile_document(final_content)
+        readability, tone, structure = await asyncio.gather(
+            asyncio.to_thread(self._analyze_readability, final_content, profile),
+            asyncio.to_thread(self._analyze_tone, final_content, requirements),
+            asyncio.to_thread(self._analyze_structure, final_content, profile)
+        )
+
+        writer_output = {
+            'content': final_content,
+            'content_plan': content_plan,
+            'word_count': profile.word_count,
+            'readability_metrics': readability,
+            'tone_analysis': tone,
+            'structure_analysis': structure,
+            'writing_notes': list(self._generate_writing_notes(content_plan, final_content, profile.word_count))
+        }
+
+        self._draft_cache.put(cache_scope, cache_text, writer_output)
+
+        return writer_output
+
+    async def create_content_stream(self, research_data: Dict[str, Any], requirements: Dict[str, Any]):
+        """
+        Stream drafted sections as each one finishes
+
+        Yields (section_title, markdown) pairs — the document title
+        first, then sections in completion order — so a UI can start
+        rendering at first-section latency instead of waiting for the
+        whole article. Callers that need the assembled document can
+        accumulate the fragments and join them.
+        """
+        content_plan = self._create_content_plan(research_data, requirements)
+        outline = content_plan.get('outline', [])
+        word_targets = content_plan.get('section_word_targets', {})
+
+        yield 'title', f"# {content_plan.get('topic', '')}: A Comprehensive Guide"
+
+        async def _draft_one(section_title: str):
+            content = await asyncio.to_thread(
+                self._write_section, section_title, content_plan,
+                word_targets.get(section_title, 150))
+            if not content.startswith('#'):
+                content = f"## {section_title}\n\n{content}"
+            return section_title, content
+
+        tasks = [asyncio.ensure_future(_draft_one(title)) for title in outline]
+        for completed in asyncio.as_completed(tasks):
+            yield await completed
+
+    async def _agenerate_content_sections(self, content_plan: Dict[str, Any],
+                                          max_concurrency: int = 8) -> Dict[str, str]:
+        """Draft every section concurrently, preserving outline order"""
+        outline = content_plan.get('outline', [])
+        word_targets = content_plan.get('section_word_targets', {})
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _write_one(section_title: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._write_section, section_title, content_plan,
+                    word_targets.get(section_title, 150))
+
+        drafts = await asyncio.gather(*(_write_one(title) for title in outline))
+        return dict(zip(outline, drafts))
+
     def _create_content_plan(self, research_data: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Create a detailed content creation plan"""
         topic = research_data.get('topic', requirements.get('topic', ''))
-        outline = research_data.get('content_outline', [])
-        
+
+        # Build the outline once (not once per use) and intern the
+        # titles: the same strings key section_word_targets and the
+        # generated-sections dict, so later lookups compare by identity
+        outline = [sys.intern(title)
+                   for title in research_data.get('content_outline', [])
+                   ] or self._create_default_outline(topic)
+
         plan = {
             'topic': topic,
             'target_word_count': requirements.get('word_count', 1000),
             'tone': requirements.get('tone', 'Professional'),
             'target_audience': requirements.get('target_audience', 'General audience'),
             'content_type': requirements.get('content_type', 'Blog post'),
-            'outline': outline or self._create_default_outline(topic),
+            'outline': outline,
             'key_points': research_data.get('key_facts', []),
             'statistics': research_data.get('statistics', []),
             'quotes': research_data.get('expert_quotes', []),
             'section_word_targets': self._calculate_section_word_targets(
-                outline or self._create_default_outline(topic), 
+                outline,
                 requirements.get('word_count', 1000)
             )
         }
-        
+
         return plan
-    
+
     def _create_default_outline(self, topic: str) -> List[str]:
         """Create a default outline if none provided"""
-        return [
+        return [sys.intern(title) for title in (
             f"Introduction to {topic}",
             f"Understanding {topic}",
-            f"Key Benefits and Advantages",
-            f"Challenges and Considerations", 
-            f"Best Practices and Tips",
-            f"Future Outlook",
+            "Key Benefits and Advantages",
+            "Challenges and Considerations",
+            "Best Practices and Tips",
+            "Future Outlook",
             "Conclusion"
-        ]
+        )]
     
     def _calculate_section_word_targets(self, outline: List[str], total_words: int) -> Dict[str, int]:
         """Calculate word count targets for each section"""
@@ -131,6 +498,37 @@ class WriterAgent:
         
         return word_targets
     
+    def build_writing_task(self, content_plan: Dict[str, Any]) -> Task:
+        """
+        Build one consolidated drafting task for LLM execution
+
+        When drafting is delegated to the model, requesting every
+        section of the outline in a single structured prompt costs one
+        round-trip instead of one per section, and the parsed JSON drops
+        straight into _assemble_content in place of the per-section
+        writers.
+        """
+        outline = content_plan.get('outline', [])
+        word_targets = content_plan.get('section_word_targets', {})
+        section_specs = '; '.join(
+            f"'{title}' (~{word_targets.get(title, 150)} words)" for title in outline)
+
+        description = (
+            f"Write a {content_plan.get('content_type', 'blog post')} about "
+            f"'{content_plan.get('topic', '')}' in a "
+            f"{content_plan.get('tone', 'Professional')} tone for "
+            f"{content_plan.get('target_audience', 'a general audience')}. "
+            f"Draft these sections: {section_specs}. "
+            "Return a single JSON object mapping each section title exactly "
+            "as given to its markdown body. Respond with the JSON object only."
+        )
+
+        return Task(
+            description=description,
+            expected_output="A single JSON object mapping section titles to markdown",
+            agent=self.agent
+        )
+
     def _generate_content_sections(self, content_plan: Dict[str, Any]) -> Dict[str, str]:
         """Generate content for each section"""
         sections = {}
@@ -152,66 +550,39 @@ class WriterAgent:
         key_points = content_plan.get('key_points', [])
         statistics = content_plan.get('statistics', [])
         
-        # Create section-specific content based on title
-        if 'introduction' in section_title.lower():
+        # Create section-specific content based on title; the title is
+        # lowered once instead of once per branch
+        title_lower = section_title.lower()
+
+        if 'introduction' in title_lower:
             content = self._write_introduction(topic, tone, target_words)
-        elif 'conclusion' in section_title.lower():
+        elif 'conclusion' in title_lower:
             content = self._write_conclusion(topic, tone, target_words)
-        elif 'benefit' in section_title.lower() or 'advantage' in section_title.lower():
+        elif 'benefit' in title_lower or 'advantage' in title_lower:
             content = self._write_benefits_section(topic, key_points, statistics, target_words)
-        elif 'challenge' in section_title.lower() or 'consideration' in section_title.lower():
+        elif 'challenge' in title_lower or 'consideration' in title_lower:
             content = self._write_challenges_section(topic, target_words)
-        elif 'practice' in section_title.lower() or 'tip' in section_title.lower():
+        elif 'practice' in title_lower or 'tip' in title_lower:
             content = self._write_best_practices_section(topic, target_words)
-        elif 'future' in section_title.lower() or 'outlook' in section_title.lower():
+        elif 'future' in title_lower or 'outlook' in title_lower:
             content = self._write_future_section(topic, target_words)
         else:
             content = self._write_general_section(section_title, topic, key_points, target_words)
-        
+
         return content
     
     def _write_introduction(self, topic: str, tone: str, target_words: int) -> str:
         """Write an engaging introduction"""
-        intro_templates = {
-            'Professional': f"""In today's rapidly evolving landscape, {topic} has emerged as a critical factor for success. Understanding its implications and applications can provide significant advantages for organizations and individuals alike. This comprehensive guide explores the essential aspects of {topic}, providing insights that can help you navigate this important subject effectively.""",
-            
-            'Casual': f"""Have you ever wondered about {topic}? You're not alone! This fascinating subject has been gaining attention lately, and for good reason. Whether you're just getting started or looking to deepen your understanding, this guide will walk you through everything you need to know about {topic} in a clear, accessible way.""",
-            
-            'Technical': f"""{topic} represents a significant development in the field, offering both opportunities and challenges for implementation. This analysis provides a comprehensive examination of {topic}, including its technical foundations, practical applications, and strategic implications for stakeholders."""
-        }
-        
-        base_intro = intro_templates.get(tone, intro_templates['Professional'])
-        
-        # Expand if needed to meet word target
-        if len(base_intro.split()) < target_words:
-            addition = f"\n\nThroughout this article, we'll examine the key components of {topic}, discuss its benefits and challenges, and provide practical insights that you can apply immediately. Our goal is to equip you with the knowledge and understanding necessary to make informed decisions about {topic}."
-            base_intro += addition
-        
-        return base_intro
-    
+        return _render_introduction(topic, tone, target_words)
+
     def _write_conclusion(self, topic: str, tone: str, target_words: int) -> str:
         """Write a compelling conclusion"""
-        conclusion_templates = {
-            'Professional': f"""In conclusion, {topic} represents a significant opportunity for those who approach it strategically. The key to success lies in understanding its fundamental principles, recognizing both opportunities and challenges, and implementing best practices consistently. As the landscape continues to evolve, staying informed and adaptable will be crucial for maximizing the benefits of {topic}.""",
-            
-            'Casual': f"""So there you have it – everything you need to know about {topic}! Remember, the key is to start small, stay consistent, and keep learning as you go. Don't be afraid to experiment and find what works best for your situation. With the right approach, {topic} can make a real difference in achieving your goals.""",
-            
-            'Technical': f"""The analysis of {topic} reveals significant potential for implementation across various contexts. Success depends on careful planning, thorough understanding of requirements, and systematic execution of best practices. Future developments in this area warrant continued monitoring and evaluation."""
-        }
-        
-        base_conclusion = conclusion_templates.get(tone, conclusion_templates['Professional'])
-        
-        # Add call to action if needed
-        if len(base_conclusion.split()) < target_words:
-            cta = f"\n\nAs you move forward with implementing {topic}, remember that continuous learning and adaptation are key. Consider how these insights apply to your specific situation and take the first steps toward implementation today."
-            base_conclusion += cta
-        
-        return base_conclusion
-    
+        return _render_conclusion(topic, tone, target_words)
+
     def _write_benefits_section(self, topic: str, key_points: List[str], statistics: List[str], target_words: int) -> str:
         """Write a benefits and advantages section"""
-        content = f"The advantages of {topic} are numerous and significant. Here are the key benefits you should know about:\n\n"
-        
+        parts = [f"The advantages of {topic} are numerous and significant. Here are the key benefits you should know about:\n\n"]
+
         # Add key benefits
         benefits = [
             f"**Enhanced Efficiency**: {topic} streamlines processes and reduces unnecessary complexity.",
@@ -220,122 +591,79 @@ class WriterAgent:
             f"**Competitive Advantage**: Early adoption can provide a significant edge in the marketplace.",
             f"**Scalability**: Solutions can be adapted and scaled to meet growing needs."
         ]
-        
+
         for benefit in benefits[:3]:  # Limit to top 3
-            content += benefit + "\n\n"
-        
+            parts.append(benefit + "\n\n")
+
         # Add statistics if available
         if statistics:
-            content += "The data supports these benefits:\n\n"
+            parts.append("The data supports these benefits:\n\n")
             for stat in statistics[:2]:  # Limit to 2 statistics
-                content += f"- {stat}\n"
-            content += "\n"
-        
+                parts.append(f"- {stat}\n")
+            parts.append("\n")
+
         # Add key points if available
         if key_points:
-            content += "Research indicates that:\n\n"
+            parts.append("Research indicates that:\n\n")
             for point in key_points[:2]:  # Limit to 2 key points
-                content += f"- {point}\n"
-        
-        return content.strip()
-    
+                parts.append(f"- {point}\n")
+
+        return ''.join(parts).strip()
+
     def _write_challenges_section(self, topic: str, target_words: int) -> str:
         """Write a challenges and considerations section"""
-        content = f"While {topic} offers significant benefits, it's important to be aware of potential challenges and considerations:\n\n"
-        
-        challenges = [
-            f"**Implementation Complexity**: Getting started with {topic} may require significant planning and resources.",
-            f"**Learning Curve**: Team members may need training and time to adapt to new approaches.",
-            f"**Initial Costs**: Upfront investment may be substantial, though long-term ROI is typically positive.",
-            f"**Change Management**: Organizations must be prepared to manage the transition effectively.",
-            f"**Ongoing Maintenance**: Success requires continuous attention and optimization."
-        ]
-        
-        for challenge in challenges[:4]:  # Include 4 main challenges
-            content += challenge + "\n\n"
-        
-        content += f"Despite these challenges, most organizations find that the benefits of {topic} far outweigh the difficulties. The key is proper planning and realistic expectations."
-        
-        return content.strip()
-    
+        return _render_challenges(topic)
+
     def _write_best_practices_section(self, topic: str, target_words: int) -> str:
         """Write a best practices and tips section"""
-        content = f"To maximize success with {topic}, consider these proven best practices:\n\n"
-        
-        practices = [
-            f"**Start Small**: Begin with a pilot project to test approaches and learn before scaling up.",
-            f"**Set Clear Goals**: Define specific, measurable objectives for your {topic} initiative.",
-            f"**Invest in Training**: Ensure team members have the knowledge and skills needed for success.",
-            f"**Monitor Progress**: Regularly track metrics and adjust approaches based on results.",
-            f"**Stay Flexible**: Be prepared to adapt strategies as you learn and circumstances change.",
-            f"**Seek Expert Guidance**: Consider working with experienced professionals to accelerate progress."
-        ]
-        
-        for practice in practices:
-            content += practice + "\n\n"
-        
-        content += f"Remember, success with {topic} is often a journey rather than a destination. Continuous improvement and learning are essential components of long-term success."
-        
-        return content.strip()
-    
+        return _render_best_practices(topic)
+
     def _write_future_section(self, topic: str, target_words: int) -> str:
         """Write a future outlook section"""
-        content = f"Looking ahead, the future of {topic} appears bright with several exciting developments on the horizon:\n\n"
-        
-        content += f"**Emerging Trends**: New approaches and technologies are constantly being developed, making {topic} more accessible and effective than ever before.\n\n"
-        
-        content += f"**Increased Adoption**: As more organizations recognize the value of {topic}, we can expect to see broader implementation across industries.\n\n"
-        
-        content += f"**Innovation Opportunities**: The field continues to evolve, creating new possibilities for creative applications and solutions.\n\n"
-        
-        content += f"**Integration Advances**: Future developments will likely focus on better integration with existing systems and processes.\n\n"
-        
-        content += f"For those considering {topic}, now is an excellent time to begin exploring its potential. Early adopters often have the advantage of learning and adapting before widespread adoption makes the field more competitive."
-        
-        return content.strip()
-    
+        return _render_future(topic)
+
     def _write_general_section(self, section_title: str, topic: str, key_points: List[str], target_words: int) -> str:
         """Write a general section based on title and available information"""
-        content = f"## {section_title}\n\n"
-        
-        content += f"When examining {topic} in the context of {section_title.lower()}, several important factors emerge.\n\n"
-        
+        title_lower = section_title.lower()
+        parts = [
+            f"## {section_title}\n\n",
+            f"When examining {topic} in the context of {title_lower}, several important factors emerge.\n\n"
+        ]
+
         # Add key points if available
         if key_points:
-            content += "Key considerations include:\n\n"
+            parts.append("Key considerations include:\n\n")
             for point in key_points[:3]:  # Limit to 3 points
-                content += f"- {point}\n"
-            content += "\n"
-        
+                parts.append(f"- {point}\n")
+            parts.append("\n")
+
         # Add general content to meet word target
-        content += f"Understanding these aspects of {topic} is crucial for making informed decisions and achieving optimal results. Each element plays a vital role in the overall success of any {topic} initiative.\n\n"
-        
-        content += f"As you consider how {section_title.lower()} relates to your specific situation, remember that context matters significantly. What works in one scenario may need adaptation for another, making careful analysis and planning essential components of success."
-        
-        return content.strip()
-    
+        parts.append(f"Understanding these aspects of {topic} is crucial for making informed decisions and achieving optimal results. Each element plays a vital role in the overall success of any {topic} initiative.\n\n")
+
+        parts.append(f"As you consider how {title_lower} relates to your specific situation, remember that context matters significantly. What works in one scenario may need adaptation for another, making careful analysis and planning essential components of success.")
+
+        return ''.join(parts).strip()
+
     def _assemble_content(self, content_sections: Dict[str, str], requirements: Dict[str, Any]) -> str:
         """Assemble final content from sections"""
         topic = requirements.get('topic', '')
-        content_type = requirements.get('content_type', 'Blog post')
-        
-        # Create title
-        title = f"# {topic}: A Comprehensive Guide\n\n"
-        
-        # Assemble sections
-        final_content = title
+
+        # Title first, then sections, joined once at the end
+        parts = [f"# {topic}: A Comprehensive Guide\n\n"]
         for section_title, section_content in content_sections.items():
             if not section_content.startswith('#'):
-                final_content += f"## {section_title}\n\n"
-            final_content += section_content + "\n\n"
-        
-        return final_content.strip()
+                parts.append(f"## {section_title}\n\n")
+            parts.append(section_content + "\n\n")
+
+        return ''.join(parts).strip()
     
-    def _analyze_readability(self, content: str) -> Dict[str, Any]:
+    def _analyze_readability(self, content: str, profile: Optional[_DocProfile] = None) -> Dict[str, Any]:
         """Analyze content readability"""
-        sentences = len([s for s in content.split('.') if s.strip()])
-        words = len(content.split())
-        
+        if profile is None:
+            profile = _profile_document(content)
+        sentences = profile.sentence_count
+        words = profile.word_count
+
         if sentences == 0:
             return {'score': 0, 'assessment': 'No readable content'}
         
@@ -371,67 +699,67 @@ class WriterAgent:
     def _analyze_tone(self, content: str, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze content tone"""
         target_tone = requirements.get('tone', 'Professional')
-        content_lower = content.lower()
-        
-        # Simple tone indicators
-        tone_indicators = {
-            'Professional': ['analysis', 'implementation', 'strategic', 'comprehensive', 'significant'],
-            'Casual': ['you', 'your', 'easy', 'simple', 'great', 'awesome'],
-            'Technical': ['system', 'process', 'methodology', 'parameters', 'optimization']
-        }
-        
+
+        # One scan finds every indicator; presence (not frequency) still
+        # drives the score, and the containment check keeps short
+        # indicators counted when a longer match covers them
+        found = _find_tone_indicators(content)
+
         detected_indicators = {}
-        for tone, indicators in tone_indicators.items():
-            count = sum(1 for indicator in indicators if indicator in content_lower)
+        for tone, indicators in _TONE_INDICATORS.items():
+            count = sum(1 for indicator in indicators
+                        if any(indicator in match for match in found))
             detected_indicators[tone] = count
-        
+
         detected_tone = max(detected_indicators, key=detected_indicators.get)
         tone_match = detected_tone == target_tone
-        
+
         return {
             'target_tone': target_tone,
             'detected_tone': detected_tone,
             'tone_match': tone_match,
-            'confidence': detected_indicators[detected_tone] / len(tone_indicators[detected_tone]),
+            'confidence': detected_indicators[detected_tone] / len(_TONE_INDICATORS[detected_tone]),
             'recommendations': [] if tone_match else [f"Content tone appears more {detected_tone} than {target_tone}"]
         }
     
-    def _analyze_structure(self, content: str) -> Dict[str, Any]:
+    def _analyze_structure(self, content: str, profile: Optional[_DocProfile] = None) -> Dict[str, Any]:
         """Analyze content structure"""
-        lines = content.split('\n')
-        paragraphs = [p for p in content.split('\n\n') if p.strip()]
-        
-        headings = [line for line in lines if line.startswith('#')]
-        
+        if profile is None:
+            profile = _profile_document(content)
+        paragraph_count = profile.paragraph_count
+        heading_count = profile.heading_count
+
         return {
-            'paragraph_count': len(paragraphs),
-            'heading_count': len(headings),
-            'avg_paragraph_length': sum(len(p.split()) for p in paragraphs) / len(paragraphs) if paragraphs else 0,
-            'has_proper_structure': len(headings) > 0 and len(paragraphs) > 2,
-            'structure_score': min(100, (len(headings) * 20) + (min(len(paragraphs), 8) * 10))
+            'paragraph_count': paragraph_count,
+            'heading_count': heading_count,
+            'avg_paragraph_length': profile.word_count / paragraph_count if paragraph_count else 0,
+            'has_proper_structure': heading_count > 0 and paragraph_count > 2,
+            'structure_score': min(100, (heading_count * 20) + (min(paragraph_count, 8) * 10))
         }
     
-    def _generate_writing_notes(self, content_plan: Dict[str, Any], final_content: str) -> List[str]:
-        """Generate notes about the writing process"""
-        notes = []
-        
+    def _generate_writing_notes(self, content_plan: Dict[str, Any], final_content: str,
+                                word_count: Optional[int] = None) -> Iterator[str]:
+        """Yield notes about the writing process
+
+        Lazy generator: no note strings are built unless a caller actually
+        consumes them, and all counts come precomputed from the plan and
+        the document profile.
+        """
         target_words = content_plan.get('target_word_count', 1000)
-        actual_words = len(final_content.split())
-        
+        actual_words = word_count if word_count is not None else len(final_content.split())
+
         if actual_words < target_words * 0.9:
-            notes.append(f"Content is shorter than target ({actual_words} vs {target_words} words)")
+            yield f"Content is shorter than target ({actual_words} vs {target_words} words)"
         elif actual_words > target_words * 1.1:
-            notes.append(f"Content is longer than target ({actual_words} vs {target_words} words)")
+            yield f"Content is longer than target ({actual_words} vs {target_words} words)"
         else:
-            notes.append(f"Content length is appropriate ({actual_words} words)")
-        
+            yield f"Content length is appropriate ({actual_words} words)"
+
         if content_plan.get('statistics'):
-            notes.append(f"Incorporated {len(content_plan['statistics'])} statistics from research")
-        
+            yield f"Incorporated {len(content_plan['statistics'])} statistics from research"
+
         if content_plan.get('quotes'):
-            notes.append(f"Referenced {len(content_plan['quotes'])} expert quotes")
-        
-        notes.append("Content follows planned outline structure")
-        notes.append(f"Tone optimized for {content_plan.get('target_audience', 'general')} audience")
-        
-        return notes 
\ No newline at end of file
+            yield f"Referenced {len(content_plan['quotes'])} expert quotes"
+
+        yield "Content follows planned outline structure"
+        yield f"Tone optimized for {content_plan.get('target_audience', 'general')} audience"
\ No newline at end of file
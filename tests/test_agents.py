@@ -56,6 +56,23 @@ class TestCoordinatorAgent(unittest.TestCase):
         self.assertIn('passed', validation)
         self.assertIn('checks', validation)
 
+    def test_validate_many_batch(self):
+        """Test batch validation through the process pool (n > 1)"""
+        coordinator = CoordinatorAgent()
+        plan = coordinator.create_content_plan(self.requirements)
+
+        contents = [
+            "This is the first test content. " * 100,
+            "This is the second test content. " * 100
+        ]
+        results = coordinator.validate_many(contents, plan, max_workers=2)
+
+        self.assertEqual(len(results), 2)
+        for validation in results:
+            self.assertIn('overall_score', validation)
+            self.assertIn('passed', validation)
+            self.assertIn('checks', validation)
+
 
 class TestResearchAgent(unittest.TestCase):
     """Test the Research Agent functionality"""
@@ -197,7 +214,17 @@ class TestSEOAgent(unittest.TestCase):
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete pipeline"""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the agents once for the whole class — construction is
+        the dominant cost and the agents are stateless between tests"""
+        cls.coordinator = CoordinatorAgent()
+        cls.researcher = ResearchAgent()
+        cls.writer = WriterAgent()
+        cls.editor = EditorAgent()
+        cls.seo_agent = SEOAgent()
+
     def setUp(self):
         """Set up test fixtures"""
         self.requirements = {
@@ -221,34 +248,27 @@ class TestIntegration(unittest.TestCase):
             }
         ]
         
-        # Initialize agents
-        coordinator = CoordinatorAgent()
-        researcher = ResearchAgent()
-        writer = WriterAgent()
-        editor = EditorAgent()
-        seo_agent = SEOAgent()
-        
         # Test pipeline steps
-        plan = coordinator.create_content_plan(self.requirements)
+        plan = self.coordinator.create_content_plan(self.requirements)
         self.assertIsInstance(plan, dict)
-        
-        research = researcher.conduct_research(self.requirements['topic'], self.requirements)
+
+        research = self.researcher.conduct_research(self.requirements['topic'], self.requirements)
         self.assertIsInstance(research, dict)
-        
-        writing = writer.create_content(research, self.requirements)
+
+        writing = self.writer.create_content(research, self.requirements)
         self.assertIsInstance(writing, dict)
         self.assertIn('content', writing)
-        
-        editing = editor.edit_content(writing['content'], self.requirements)
+
+        editing = self.editor.edit_content(writing['content'], self.requirements)
         self.assertIsInstance(editing, dict)
         self.assertIn('edited_content', editing)
-        
-        seo = seo_agent.optimize_content(editing['edited_content'], self.requirements)
+
+        seo = self.seo_agent.optimize_content(editing['edited_content'], self.requirements)
         self.assertIsInstance(seo, dict)
         self.assertIn('optimized_content', seo)
-        
+
         # Final validation
-        final_report = coordinator.create_final_report(
+        final_report = self.coordinator.create_final_report(
             seo['optimized_content'], plan, {
                 'research': research,
                 'writing': writing, 
@@ -2,12 +2,19 @@
 Utility functions and configurations for the AI Multi-Agent Content Creation Pipeline
 """
 
-from .llm_config import get_llm, configure_llm
+from .batch import run_batch, run_batch_sync
+from .llm_config import get_llm, configure_llm, batch_invoke, abatch_invoke
+from .semantic_cache import SemanticCache
 from .tools import WebSearchTool, ContentValidatorTool, SEOAnalyzerTool
 
 __all__ = [
     'get_llm',
-    'configure_llm', 
+    'configure_llm',
+    'batch_invoke',
+    'abatch_invoke',
+    'run_batch',
+    'run_batch_sync',
+    'SemanticCache',
     'WebSearchTool',
     'ContentValidatorTool',
     'SEOAnalyzerTool'
@@ -0,0 +1,78 @@
+"""
+Batched LLM execution for the AI Multi-Agent Content Creation Pipeline
+
+This module provides a shared batch runner for agent steps that fan out
+into several independent prompts (research sub-queries, keyword
+expansion, FAQ generation). Prompts are collected into a list and run
+concurrently through one client with a concurrency cap and a
+requests-per-minute limit, so N independent completions cost roughly
+one round trip instead of N sequential ones while staying under the
+provider's rate limits.
+"""
+
+import asyncio
+import time
+from typing import Any, List, Optional
+
+from langchain_openai import ChatOpenAI
+
+from .llm_config import get_llm
+
+class _RateLimiter:
+    """Simple requests-per-minute pacer shared by one batch"""
+
+    def __init__(self, rpm: int):
+        self.min_interval = 60.0 / rpm if rpm else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.min_interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+async def run_batch(
+    prompts: List[str],
+    llm: Optional[ChatOpenAI] = None,
+    max_concurrency: int = 10,
+    rpm: int = 100
+) -> List[Any]:
+    """
+    Run independent prompts concurrently through one LLM client
+
+    Args:
+        prompts: Prompts to run
+        llm: Configured LLM instance (defaults to the standard client)
+        max_concurrency: Maximum prompts in flight at once
+        rpm: Requests-per-minute ceiling across the whole batch
+
+    Returns:
+        List of responses in prompt order
+    """
+    if not prompts:
+        return []
+
+    client = llm or get_llm()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = _RateLimiter(rpm)
+
+    async def _one(prompt: str) -> Any:
+        async with semaphore:
+            await limiter.wait()
+            return await client.ainvoke(prompt)
+
+    return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+
+def run_batch_sync(
+    prompts: List[str],
+    llm: Optional[ChatOpenAI] = None,
+    max_concurrency: int = 10,
+    rpm: int = 100
+) -> List[Any]:
+    """Blocking wrapper around run_batch for sync call sites"""
+    return asyncio.run(run_batch(prompts, llm, max_concurrency, rpm))
@@ -5,14 +5,21 @@ This module handles the configuration and initialization of different Language L
 for the AI Multi-Agent Content Creation Pipeline.
 """
 
+import functools
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Model routing: mechanical roles (structured planning, editing, SEO) run
+# fine on the small, cheap model, while creative/synthesis-heavy roles get
+# the larger one. Both tiers are overridable from the environment.
+SMALL_MODEL = os.getenv('OPENAI_SMALL_MODEL', 'gpt-3.5-turbo')
+LARGE_MODEL = os.getenv('OPENAI_LARGE_MODEL', os.getenv('OPENAI_MODEL', 'gpt-4-turbo'))
+
 class LLMConfig:
     """Configuration class for Language Learning Models"""
     
@@ -32,6 +39,20 @@ class LLMConfig:
             'google': bool(self.google_api_key and self.google_api_key != 'your_google_api_key_here')
         }
 
+@functools.lru_cache(maxsize=1)
+def _get_config() -> LLMConfig:
+    """Build the LLMConfig once per process
+
+    Environment variables don't change mid-run, so every get_llm call
+    re-reading and re-validating them was pure overhead.
+    """
+    return LLMConfig()
+
+def reset_llm_config():
+    """Clear the cached config and role clients after environment changes"""
+    _get_config.cache_clear()
+    configure_llm.cache_clear()
+
 def get_llm(
     model_name: Optional[str] = None,
     temperature: Optional[float] = None,
@@ -50,8 +71,8 @@ def get_llm(
     Returns:
         Configured LLM instance
     """
-    config = LLMConfig()
-    
+    config = _get_config()
+
     # Validate that we have the required API key
     valid_keys = config.validate_api_keys()
     if not valid_keys['openai']:
@@ -72,34 +93,45 @@ def get_llm(
         **kwargs
     )
 
+@functools.lru_cache(maxsize=8)
 def configure_llm(agent_role: str) -> ChatOpenAI:
     """
     Configure LLM for specific agent roles with optimized parameters
-    
+
+    Results are cached per role so repeated agent construction reuses a
+    single connection-pooled client instead of rebuilding one each time.
+    Callers share the returned instance and must not mutate its state;
+    use reset_llm_config() to drop cached clients after env changes.
+
     Args:
         agent_role: The role of the agent (coordinator, researcher, writer, editor, seo)
-        
+
     Returns:
         Configured LLM instance optimized for the agent role
     """
     role_configs = {
         'coordinator': {
+            'model_name': SMALL_MODEL,  # Structured planning suits the cheap tier
             'temperature': 0.3,  # Lower temperature for more structured coordination
             'max_tokens': 2000
         },
         'researcher': {
+            'model_name': LARGE_MODEL,  # Synthesis across sources needs the stronger tier
             'temperature': 0.5,  # Balanced for factual research
             'max_tokens': 3000
         },
         'writer': {
+            'model_name': LARGE_MODEL,  # Creative drafting needs the stronger tier
             'temperature': 0.8,  # Higher temperature for creative writing
             'max_tokens': 4000
         },
         'editor': {
+            'model_name': SMALL_MODEL,  # Mechanical edits suit the cheap tier
             'temperature': 0.4,  # Lower temperature for precise editing
             'max_tokens': 3000
         },
         'seo': {
+            'model_name': SMALL_MODEL,  # Technical SEO checks suit the cheap tier
             'temperature': 0.3,  # Lower temperature for technical SEO tasks
             'max_tokens': 2000
         }
@@ -108,6 +140,28 @@ def configure_llm(agent_role: str) -> ChatOpenAI:
     config = role_configs.get(agent_role, {})
     return get_llm(**config)
 
+def batch_invoke(llm: ChatOpenAI, prompts: List[str], max_concurrency: int = 5) -> List[Any]:
+    """
+    Run several prompts through one LLM client as a single batch
+
+    Uses LangChain's batch API so independent prompts share the client's
+    connection pool and run concurrently up to max_concurrency, instead
+    of paying one round trip per sequential invoke() call.
+
+    Args:
+        llm: Configured LLM instance
+        prompts: Prompts to run
+        max_concurrency: Maximum prompts in flight at once
+
+    Returns:
+        List of responses in prompt order
+    """
+    return llm.batch(prompts, config={'max_concurrency': max_concurrency})
+
+async def abatch_invoke(llm: ChatOpenAI, prompts: List[str], max_concurrency: int = 5) -> List[Any]:
+    """Async variant of batch_invoke for use inside the async pipeline"""
+    return await llm.abatch(prompts, config={'max_concurrency': max_concurrency})
+
 def get_available_models() -> Dict[str, Dict[str, Any]]:
     """
     Get information about available models
@@ -0,0 +1,101 @@
+"""
+Semantic Cache for AI Multi-Agent Content Creation Pipeline
+
+This module provides a lightweight semantic cache that lets expensive
+pipeline entry points (planning, full content runs) return previously
+computed results for near-duplicate requirement sets. Requirements are
+embedded as bag-of-words vectors and matched by cosine similarity, so
+requests that differ only in phrasing (e.g., same topic, slightly
+different tone wording) can reuse cached output instead of re-triggering
+the LLM-heavy pipeline.
+"""
+
+import math
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+class SemanticCache:
+    """
+    Cache keyed by semantic similarity of text descriptions
+
+    Entries are grouped under a scope key (for non-semantic fields such as
+    content type or word-count bucket) and matched within that scope by
+    cosine similarity of a simple bag-of-words embedding. This is a
+    simplified approach - in production, you'd use a dedicated embedding
+    model with an ANN index for sub-millisecond lookups.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.9, max_entries: int = 256):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        # scope key -> list of (embedding, value) pairs
+        self._entries: Dict[Any, List[Tuple[Counter, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, scope: Any, text: str) -> Optional[Any]:
+        """
+        Look up a cached value for text within a scope
+
+        Args:
+            scope: Hashable key for the non-semantic portion of the request
+            text: Text description to match semantically
+
+        Returns:
+            The cached value if a sufficiently similar entry exists, else None
+        """
+        embedding = self._embed(text)
+
+        best_score = 0.0
+        best_value = None
+        for cached_embedding, value in self._entries.get(scope, []):
+            score = self._cosine_similarity(embedding, cached_embedding)
+            if score > best_score:
+                best_score = score
+                best_value = value
+
+        if best_score >= self.similarity_threshold:
+            self.hits += 1
+            return best_value
+
+        self.misses += 1
+        return None
+
+    def put(self, scope: Any, text: str, value: Any) -> None:
+        """Store a value for text within a scope"""
+        entries = self._entries.setdefault(scope, [])
+        entries.append((self._embed(text), value))
+
+        # Evict oldest entries once the scope grows too large
+        if len(entries) > self.max_entries:
+            del entries[0]
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _embed(text: str) -> Counter:
+        """Embed text as a bag-of-words term-frequency vector"""
+        return Counter(text.lower().split())
+
+    @staticmethod
+    def _cosine_similarity(a: Counter, b: Counter) -> float:
+        """Compute cosine similarity between two term-frequency vectors"""
+        if not a or not b:
+            return 0.0
+
+        # Iterate over the smaller vector for the dot product
+        if len(a) > len(b):
+            a, b = b, a
+
+        dot_product = sum(count * b[term] for term, count in a.items())
+        if dot_product == 0:
+            return 0.0
+
+        norm_a = math.sqrt(sum(count * count for count in a.values()))
+        norm_b = math.sqrt(sum(count * count for count in b.values()))
+
+        return dot_product / (norm_a * norm_b)
@@ -7,18 +7,83 @@ This module provides tools that agents can use to perform specific tasks:
 - SEO analysis and optimization
 """
 
+import asyncio
+import os
 import re
+import shelve
+import time
 import requests
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from urllib.parse import quote
 from bs4 import BeautifulSoup
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import lxml  # noqa: F401 - used as the BeautifulSoup backend
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# Compiled once at import: these run on every validation/analysis call,
+# so skipping the per-call pattern parse and cache lookup matters on the
+# hot path.
+_END_PUNCT_RE = re.compile(r'[.!?]$')
+_HAS_HEADING_RE = re.compile(r'#+\s')
+_HEADING_RE = re.compile(r'^(#+)\s+(.+)$', re.MULTILINE)
+_LIST_RE = re.compile(r'^\s*[-*+]\s', re.MULTILINE)
+_LINK_RE = re.compile(r'\[.*?\]\(.*?\)')
+
+# Opt-in on-disk cache for web searches: reruns, retries and overlapping
+# research topics repeat second-scale HTTP round trips that a persistent
+# cache makes free. Enabled with WEB_SEARCH_CACHE=1.
+_SEARCH_CACHE_PATH = os.path.join('.cache', 'web_search')
+_SEARCH_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Sentence terminators normalized to '.' so counting and first-sentence
+# extraction run as C-level translate/count/split passes instead of
+# regex scans
+_SENT_END_TRANS = str.maketrans('!?', '..')
+
+def _count_sentences(content: str) -> int:
+    """Count sentence-ending punctuation runs without the regex engine
+
+    Collapsing consecutive terminators keeps the [.!?]+ semantics — an
+    ellipsis or '?!' still ends exactly one sentence — while every pass
+    is a C-level string operation.
+    """
+    marked = content.translate(_SENT_END_TRANS)
+    while '..' in marked:
+        marked = marked.replace('..', '.')
+    return marked.count('.')
+
 class WebSearchTool:
     """Tool for conducting web searches and extracting relevant information"""
     
     name: str = "Web Search Tool"
     description: str = "Search the web for information on a given topic and return relevant snippets"
-    
+
+    _session: Optional[requests.Session] = None
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """One pooled session per process so repeat searches reuse connections
+
+        A fresh requests.get pays TCP and TLS setup on every call; the
+        shared session keeps the connection alive across queries.
+        """
+        if cls._session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = (
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            )
+            cls._session = session
+        return cls._session
+
     def run(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
         """
         Perform web search and return results
@@ -30,15 +95,20 @@ class WebSearchTool:
         Returns:
             List of search results with title, snippet, and URL
         """
+        cache_enabled = os.getenv('WEB_SEARCH_CACHE') == '1'
+        cache_key = f'{num_results}:{query}'
+
+        if cache_enabled:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             # Using a simple search approach - in production, you'd use proper search APIs
             search_url = f"https://www.google.com/search?q={quote(query)}&num={num_results}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+
+            response = self._get_session().get(search_url, timeout=10)
+            soup = BeautifulSoup(response.content, _SOUP_PARSER)
             
             results = []
             search_results = soup.find_all('div', class_='g')[:num_results]
@@ -58,12 +128,50 @@ class WebSearchTool:
                         'url': url,
                         'snippet': snippet
                     })
-            
+
+            # Only successful lookups are worth keeping — never cache errors
+            if cache_enabled:
+                self._cache_put(cache_key, results)
+
             return results
             
         except Exception as e:
             return [{'error': f'Search failed: {str(e)}'}]
 
+    @staticmethod
+    def _cache_get(key: str) -> Optional[List[Dict[str, str]]]:
+        """Return unexpired cached results for key, or None"""
+        try:
+            with shelve.open(_SEARCH_CACHE_PATH) as cache:
+                stamped = cache.get(key)
+        except OSError:
+            return None
+        if stamped and time.time() - stamped[0] < _SEARCH_CACHE_TTL:
+            return stamped[1]
+        return None
+
+    @staticmethod
+    def _cache_put(key: str, results: List[Dict[str, str]]):
+        """Store results under key with the current timestamp"""
+        try:
+            os.makedirs(os.path.dirname(_SEARCH_CACHE_PATH), exist_ok=True)
+            with shelve.open(_SEARCH_CACHE_PATH) as cache:
+                cache[key] = (time.time(), results)
+        except OSError:
+            pass  # A failed cache write must never break the search itself
+
+    async def run_async(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
+        """Async wrapper so searches can run on the pipeline's event loop"""
+        return await asyncio.to_thread(self.run, query, num_results)
+
+    async def run_many(self, queries: List[str], num_results: int = 5) -> List[List[Dict[str, str]]]:
+        """Run several searches concurrently
+
+        Independent queries overlap their network round trips, so a
+        batch costs roughly one RTT instead of one per query.
+        """
+        return await asyncio.gather(*(self.run_async(query, num_results) for query in queries))
+
 class ContentValidatorTool:
     """Tool for validating content quality and coherence"""
     
@@ -81,13 +189,19 @@ class ContentValidatorTool:
             Dictionary with validation results
         """
         try:
+            # Tokenize once and share the results with the helpers
+            # instead of re-splitting the same string inside each one
+            words = content.split()
+            sentence_count = _count_sentences(content)
+            paragraphs = [p for p in content.split('\n\n') if p.strip()]
+
             validation_results = {
-                'word_count': len(content.split()),
+                'word_count': len(words),
                 'character_count': len(content),
-                'sentence_count': len(re.split(r'[.!?]+', content)) - 1,
-                'paragraph_count': len([p for p in content.split('\n\n') if p.strip()]),
-                'readability_score': self._calculate_readability(content),
-                'issues': self._identify_issues(content),
+                'sentence_count': sentence_count,
+                'paragraph_count': len(paragraphs),
+                'readability_score': self._calculate_readability(len(words), sentence_count),
+                'issues': self._identify_issues(content, words, paragraphs),
                 'quality_score': 0
             }
             
@@ -99,43 +213,38 @@ class ContentValidatorTool:
         except Exception as e:
             return {'error': f'Validation failed: {str(e)}'}
     
-    def _calculate_readability(self, content: str) -> float:
+    def _calculate_readability(self, word_count: int, sentence_count: int) -> float:
         """Calculate a simple readability score (0-100)"""
-        sentences = len(re.split(r'[.!?]+', content)) - 1
-        words = len(content.split())
-        
-        if sentences == 0:
+        if sentence_count == 0:
             return 0
-            
-        avg_sentence_length = words / sentences
-        
+
+        avg_sentence_length = word_count / sentence_count
+
         # Simple readability calculation (lower is better)
         readability = max(0, 100 - (avg_sentence_length * 2))
         return round(readability, 2)
     
-    def _identify_issues(self, content: str) -> List[str]:
+    def _identify_issues(self, content: str, words: List[str], paragraphs: List[str]) -> List[str]:
         """Identify potential issues with the content"""
         issues = []
-        
+
         # Check for very long paragraphs
-        paragraphs = [p for p in content.split('\n\n') if p.strip()]
         for i, para in enumerate(paragraphs):
-            if len(para.split()) > 200:
-                issues.append(f"Paragraph {i+1} is very long ({len(para.split())} words)")
-        
-        # Check for repetitive phrases
-        words = content.lower().split()
-        word_freq = {}
-        for word in words:
-            if len(word) > 5:  # Only check longer words
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
+            para_words = len(para.split())
+            if para_words > 200:
+                issues.append(f"Paragraph {i+1} is very long ({para_words} words)")
+
+        # Check for repetitive phrases — Counter runs the tally in C,
+        # and lowercasing the shared word list avoids re-splitting a
+        # lowered copy of the whole content
+        word_freq = Counter(word.lower() for word in words if len(word) > 5)
+
         for word, freq in word_freq.items():
             if freq > 10:
                 issues.append(f"Word '{word}' appears {freq} times (potentially repetitive)")
         
         # Check for missing punctuation
-        if not re.search(r'[.!?]$', content.strip()):
+        if not _END_PUNCT_RE.search(content.strip()):
             issues.append("Content doesn't end with proper punctuation")
         
         return issues
@@ -204,62 +313,78 @@ class SEOAnalyzerTool:
     def _analyze_keywords(self, content: str, keywords: List[str]) -> Dict[str, Any]:
         """Analyze keyword usage in content"""
         content_lower = content.lower()
-        
+        total_words = len(content.split())
+
         keyword_analysis = {
             'target_keywords': keywords,
             'keyword_density': {},
             'keyword_positions': {},
             'missing_keywords': []
         }
-        
+
+        positions_by_kw = self._find_keyword_positions(content_lower, keywords)
+
         for keyword in keywords:
-            keyword_lower = keyword.lower()
-            count = content_lower.count(keyword_lower)
-            total_words = len(content.split())
-            
+            positions = positions_by_kw.get(keyword.lower(), [])
+
             if total_words > 0:
-                density = (count / total_words) * 100
+                density = (len(positions) / total_words) * 100
                 keyword_analysis['keyword_density'][keyword] = round(density, 2)
-            
-            # Find positions
-            positions = []
-            start = 0
-            while True:
-                pos = content_lower.find(keyword_lower, start)
-                if pos == -1:
-                    break
-                positions.append(pos)
-                start = pos + 1
-            
+
             keyword_analysis['keyword_positions'][keyword] = positions
-            
-            if count == 0:
+
+            if not positions:
                 keyword_analysis['missing_keywords'].append(keyword)
-        
+
         return keyword_analysis
+
+    @staticmethod
+    def _find_keyword_positions(content_lower: str, keywords: List[str]) -> Dict[str, List[int]]:
+        """Locate every occurrence of every keyword, keyed by lowered keyword
+
+        With pyahocorasick available this is a single pass over the
+        content that reports all (including overlapping) occurrences of
+        all keywords at once, instead of one Python-level find loop per
+        keyword. The fallback runs one C-level regex scan per keyword.
+        """
+        lowered = {keyword.lower() for keyword in keywords}
+        positions_by_kw = {keyword_lower: [] for keyword_lower in lowered}
+
+        if ahocorasick is not None and lowered:
+            automaton = ahocorasick.Automaton()
+            for keyword_lower in lowered:
+                automaton.add_word(keyword_lower, keyword_lower)
+            automaton.make_automaton()
+            for end_index, keyword_lower in automaton.iter(content_lower):
+                positions_by_kw[keyword_lower].append(end_index - len(keyword_lower) + 1)
+        else:
+            for keyword_lower in lowered:
+                pattern = re.compile(f'(?={re.escape(keyword_lower)})')
+                positions_by_kw[keyword_lower] = [m.start() for m in pattern.finditer(content_lower)]
+
+        return positions_by_kw
     
     def _analyze_structure(self, content: str) -> Dict[str, Any]:
         """Analyze content structure for SEO"""
-        structure = {
-            'has_headings': bool(re.search(r'#+\s', content)),  # Markdown headings
+        # One word split and one paragraph split serve every field below:
+        # summing per-paragraph splits gives the same total as splitting
+        # the whole content, so the second tokenization pass was pure waste
+        word_count = len(content.split())
+        paragraphs = [p for p in content.split('\n\n') if p.strip()]
+
+        return {
+            'has_headings': bool(_HAS_HEADING_RE.search(content)),  # Markdown headings
             'heading_hierarchy': self._check_heading_hierarchy(content),
-            'paragraph_count': len([p for p in content.split('\n\n') if p.strip()]),
-            'avg_paragraph_length': 0,
-            'has_lists': bool(re.search(r'^\s*[-*+]\s', content, re.MULTILINE)),
-            'internal_links': len(re.findall(r'\[.*?\]\(.*?\)', content)),
-            'word_count': len(content.split())
+            'paragraph_count': len(paragraphs),
+            'avg_paragraph_length': round(word_count / len(paragraphs), 1) if paragraphs else 0,
+            'has_lists': bool(_LIST_RE.search(content)),
+            'internal_links': len(_LINK_RE.findall(content)),
+            'word_count': word_count
         }
-        
-        paragraphs = [p for p in content.split('\n\n') if p.strip()]
-        if paragraphs:
-            total_words = sum(len(p.split()) for p in paragraphs)
-            structure['avg_paragraph_length'] = round(total_words / len(paragraphs), 1)
-        
-        return structure
     
     def _check_heading_hierarchy(self, content: str) -> List[str]:
         """Check heading hierarchy in content"""
-        headings = re.findall(r'^(#+)\s+(.+)$', content, re.MULTILINE)
+        headings = _HEADING_RE.findall(content)
         hierarchy = []
         
         for level, text in headings:
@@ -269,8 +394,9 @@ class SEOAnalyzerTool:
     
     def _generate_meta_suggestions(self, content: str) -> Dict[str, str]:
         """Generate meta tag suggestions"""
-        sentences = re.split(r'[.!?]+', content)
-        first_sentence = sentences[0].strip() if sentences else ""
+        # Text before the first terminator contains no '!' or '?', so the
+        # translated slice is identical to the regex split's first field
+        first_sentence = content.translate(_SENT_END_TRANS).split('.', 1)[0].strip()
         
         # Generate title suggestion (first sentence or first 60 characters)
         title_suggestion = first_sentence[:60] + "..." if len(first_sentence) > 60 else first_sentence